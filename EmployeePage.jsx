@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '../api';
+import api, { getAllPages } from '../api';
 
 export default function EmployeePage() {
   const [activeTab, setActiveTab] = useState('schedules');
@@ -40,8 +40,7 @@ export default function EmployeePage() {
   const fetchSchedules = async () => {
     setLoading(true);
     try {
-      const response = await api.get('/employee/schedules');
-      setSchedules(response.data);
+      setSchedules(await getAllPages('/employee/schedules'));
     } catch (error) {
       alert('Failed to fetch schedules');
     } finally {
@@ -52,8 +51,7 @@ export default function EmployeePage() {
   const fetchAttendance = async () => {
     setLoading(true);
     try {
-      const response = await api.get('/employee/attendance');
-      setAttendance(response.data);
+      setAttendance(await getAllPages('/employee/attendance'));
     } catch (error) {
       alert('Failed to fetch attendance');
     } finally {
@@ -64,8 +62,7 @@ export default function EmployeePage() {
   const fetchOvertime = async () => {
     setLoading(true);
     try {
-      const response = await api.get('/employee/overtime');
-      setOvertime(response.data);
+      setOvertime(await getAllPages('/employee/overtime'));
     } catch (error) {
       alert('Failed to fetch overtime');
     } finally {
@@ -76,8 +73,7 @@ export default function EmployeePage() {
   const fetchLeaves = async () => {
     setLoading(true);
     try {
-      const response = await api.get('/employee/leaves');
-      setLeaves(response.data);
+      setLeaves(await getAllPages('/employee/leaves'));
     } catch (error) {
       alert('Failed to fetch leaves');
     } finally {
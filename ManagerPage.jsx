@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '../api';
+import api, { getAllPages } from '../api';
 
 export default function ManagerPage() {
   const [activeTab, setActiveTab] = useState('employees');
@@ -93,8 +93,7 @@ export default function ManagerPage() {
   const fetchOvertimes = async () => {
     setLoading(true);
     try {
-      const response = await api.get('/manager/overtime');
-      setOvertimes(response.data);
+      setOvertimes(await getAllPages('/manager/overtime'));
     } catch (error) {
       alert('Failed to fetch overtime');
     } finally {
@@ -105,8 +104,7 @@ export default function ManagerPage() {
   const fetchLeaves = async () => {
     setLoading(true);
     try {
-      const response = await api.get('/manager/leaves');
-      setLeaves(response.data);
+      setLeaves(await getAllPages('/manager/leaves'));
     } catch (error) {
       alert('Failed to fetch leaves');
     } finally {
@@ -149,7 +147,7 @@ export default function ManagerPage() {
         await api.post('/manager/schedules', formData);
         fetchSchedules();
       } else if (modalType === 'generate-schedule') {
-        const response = await api.post('/manager/schedules/generate', formData);
+        const response = await api.post('/manager/schedules/generate', formData, { params: { details: false } });
         alert(`Generated ${response.data.created} schedules`);
         fetchSchedules();
       }
@@ -26,4 +26,17 @@ api.interceptors.response.use(
   }
 );
 
+// Fetch every page of a list endpoint, following the X-Next-Offset header
+export async function getAllPages(url, params = {}) {
+  const items = [];
+  let offset = 0;
+  while (offset !== null) {
+    const response = await api.get(url, { params: { ...params, offset } });
+    items.push(...response.data);
+    const next = response.headers['x-next-offset'];
+    offset = next === undefined ? null : Number(next);
+  }
+  return items;
+}
+
 export default api;
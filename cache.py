@@ -0,0 +1,125 @@
+from typing import Callable, Optional
+from fastapi import Response
+import os
+import time
+import orjson
+import redis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_PREFIX = os.getenv("CACHE_PREFIX", "shifts")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+# Per-process cache for single-worker development only; with several workers
+# an invalidate() only reaches the worker that handled the write
+CACHE_IN_MEMORY = os.getenv("CACHE_IN_MEMORY", "false").lower() == "true"
+
+class NullBackend:
+    """No shared cache configured: every read is a miss and nothing is stored"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: int):
+        pass
+
+    def delete(self, *keys: str):
+        pass
+
+
+class InMemoryBackend:
+    """Per-process cache used when Redis is not configured (single worker dev)"""
+
+    def __init__(self):
+        self._store = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int):
+        self._store[key] = (value, time.monotonic() + ttl)
+
+    def delete(self, *keys: str):
+        for key in keys:
+            self._store.pop(key, None)
+
+
+class RedisBackend:
+    """Cache shared by all workers; Redis errors degrade to a cache miss"""
+
+    def __init__(self, url: str):
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._client.get(key)
+        except redis.RedisError:
+            return None
+
+    def set(self, key: str, value: bytes, ttl: int):
+        try:
+            self._client.set(key, value, ex=ttl)
+        except redis.RedisError:
+            pass
+
+    def delete(self, *keys: str):
+        # A failed delete leaves the entry to expire via its TTL
+        try:
+            self._client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+if REDIS_URL:
+    backend = RedisBackend(REDIS_URL)
+elif CACHE_IN_MEMORY:
+    backend = InMemoryBackend()
+else:
+    backend = NullBackend()
+
+def _key(name: str) -> str:
+    return f"{CACHE_PREFIX}:{name}"
+
+def cached_json_response(name: str, build: Callable[[], object], ttl: int = CACHE_TTL_SECONDS) -> Response:
+    """Return the cached JSON body for name, building and storing it on a miss"""
+    key = _key(name)
+    body = backend.get(key)
+    if body is None:
+        body = orjson.dumps(build())
+        backend.set(key, body, ttl)
+    return Response(content=body, media_type="application/json")
+
+def cached_page_response(name: str, build: Callable[[], tuple], ttl: int = CACHE_TTL_SECONDS) -> Response:
+    """Like cached_json_response for builds returning (payload, headers); the
+    headers are cached as a JSON line ahead of the body"""
+    key = _key(name)
+    value = backend.get(key)
+    if value is None:
+        payload, headers = build()
+        value = orjson.dumps(headers) + b"\n" + orjson.dumps(payload)
+        backend.set(key, value, ttl)
+    head, body = value.split(b"\n", 1)
+    return Response(content=body, media_type="application/json", headers=orjson.loads(head))
+
+def invalidate(*names: str):
+    """Drop cached payloads after a write"""
+    backend.delete(*(_key(name) for name in names))
+
+def revoke_sessions(user_id, ttl: int):
+    """Reject tokens issued to user_id before now; ttl should cover the token lifetime"""
+    # iat has whole-second precision, so tokens from the current second are
+    # rejected too (a login racing the revocation just has to log in again)
+    backend.set(_key(f"revoked:{user_id}"), str(int(time.time()) + 1).encode(), ttl)
+
+def sessions_revoked_before(user_id) -> Optional[int]:
+    """Issue time (epoch seconds) before which user_id's tokens are revoked"""
+    value = backend.get(_key(f"revoked:{user_id}"))
+    return int(value) if value is not None else None
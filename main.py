@@ -1,13 +1,19 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, select, literal, literal_column, delete, update, func, case, and_, extract, Time
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, contains_eager, raiseload
 from datetime import datetime, timedelta, date, time
 from typing import List, Optional
-from pydantic import BaseModel
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict
 import uuid
+import os
+import anyio
 
-from database import get_db, init_db
+from database import get_db, init_db, THREADPOOL_SIZE
 from models import (
     Admin, Manager, Department, Role, Shift, Employee, 
     Schedule, Attendance, Overtime, EmployeeLeave, Holiday
@@ -17,55 +23,106 @@ from auth import (
     decode_token, Token, ACCESS_TOKEN_EXPIRE_MINUTES
 )
 from scheduler import ShiftScheduler
+from cache import (
+    cached_json_response, cached_page_response, invalidate,
+    revoke_sessions, sessions_revoked_before
+)
 
-app = FastAPI(title="Shift Management System")
+app = FastAPI(title="Shift Management System", default_response_class=ORJSONResponse)
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# CORS middleware (comma-separated origins; leave CORS_ORIGINS empty when a
+# reverse proxy adds the CORS headers so the middleware is skipped entirely)
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:5173,http://localhost:3000").split(",")
+    if origin.strip()
 )
 
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Offset"],
+    )
+
 security = HTTPBearer()
 
+# Development guard: with RAISELOAD=1 a relationship that a list endpoint did
+# not eager-load raises instead of silently issuing one SELECT per row
+RAISELOAD = os.getenv("RAISELOAD", "0").lower() in ("1", "true")
+
+def list_load_options(*options):
+    """Eager-load options for list queries, plus raiseload("*") when RAISELOAD is set"""
+    return (*options, raiseload("*")) if RAISELOAD else options
+
+# Upper bound (and default) page size for the history list endpoints
+LIST_PAGE_LIMIT = int(os.getenv("LIST_PAGE_LIMIT", "500"))
+# Set on a list response when more rows follow; pass it back as ?offset=
+NEXT_OFFSET_HEADER = "X-Next-Offset"
+
+def paginate(rows: list, limit: int, offset: int):
+    """Trim a limit + 1 fetch to one page and build the next-offset header"""
+    if len(rows) > limit:
+        return rows[:limit], {NEXT_OFFSET_HEADER: str(offset + limit)}
+    return rows, {}
+
+def paged_response(rows: list, limit: int, offset: int) -> ORJSONResponse:
+    """JSON array response for one page of a limit + 1 fetch"""
+    rows, headers = paginate(rows, limit, offset)
+    return ORJSONResponse(rows, headers=headers)
+
+# Rows per multi-VALUES INSERT in the bulk holiday endpoint (6 binds per row)
+HOLIDAY_INSERT_BATCH_SIZE = 1000
+
+# ON CONFLICT target matching the uq_holiday_date_location expression index
+HOLIDAY_CONFLICT_TARGET = [Holiday.date, func.coalesce(Holiday.location, literal_column("''"))]
+
 # Initialize database on startup
 @app.on_event("startup")
 def startup():
     init_db()
 
+@app.on_event("startup")
+async def configure_threadpool():
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
 # ============================================================================
 # PYDANTIC SCHEMAS
 # ============================================================================
 
-class LoginRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies; keeps validation on pydantic-core's default fast path"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, str_strip_whitespace=False)
+
+class LoginRequest(RequestModel):
     username: str
     password: str
     user_type: str  # 'admin', 'manager', 'employee'
 
-class DepartmentCreate(BaseModel):
+class DepartmentCreate(RequestModel):
     name: str
     location: Optional[str] = None
 
-class DepartmentUpdate(BaseModel):
+class DepartmentUpdate(RequestModel):
     name: Optional[str] = None
     location: Optional[str] = None
 
-class ManagerCreate(BaseModel):
+class ManagerCreate(RequestModel):
     name: str
     username: str
     password: str
     department_id: uuid.UUID
 
-class ManagerUpdate(BaseModel):
+class ManagerUpdate(RequestModel):
     name: Optional[str] = None
     username: Optional[str] = None
     password: Optional[str] = None
     department_id: Optional[uuid.UUID] = None
 
-class RoleCreate(BaseModel):
+class RoleCreate(RequestModel):
     department_id: uuid.UUID
     name: str
     work_days: List[str]
@@ -76,7 +133,7 @@ class RoleCreate(BaseModel):
     monthly_overtime_limit: Optional[float] = None
     employment_type: Optional[str] = None
 
-class RoleUpdate(BaseModel):
+class RoleUpdate(RequestModel):
     name: Optional[str] = None
     work_days: Optional[List[str]] = None
     break_minutes: Optional[int] = None
@@ -86,24 +143,24 @@ class RoleUpdate(BaseModel):
     monthly_overtime_limit: Optional[float] = None
     employment_type: Optional[str] = None
 
-class ShiftCreate(BaseModel):
+class ShiftCreate(RequestModel):
     role_id: uuid.UUID
     name: str
     day_of_week: int
-    start_time: str
-    end_time: str
+    start_time: time
+    end_time: time
     priority: Optional[int] = 0
     skills_required: Optional[List[str]] = None
 
-class ShiftUpdate(BaseModel):
+class ShiftUpdate(RequestModel):
     name: Optional[str] = None
     day_of_week: Optional[int] = None
-    start_time: Optional[str] = None
-    end_time: Optional[str] = None
+    start_time: Optional[time] = None
+    end_time: Optional[time] = None
     priority: Optional[int] = None
     skills_required: Optional[List[str]] = None
 
-class EmployeeCreate(BaseModel):
+class EmployeeCreate(RequestModel):
     role_id: uuid.UUID
     name: str
     username: str
@@ -112,7 +169,7 @@ class EmployeeCreate(BaseModel):
     availability: Optional[dict] = None
     skills: Optional[List[str]] = None
 
-class EmployeeUpdate(BaseModel):
+class EmployeeUpdate(RequestModel):
     role_id: Optional[uuid.UUID] = None
     name: Optional[str] = None
     username: Optional[str] = None
@@ -122,77 +179,368 @@ class EmployeeUpdate(BaseModel):
     skills: Optional[List[str]] = None
     is_active: Optional[bool] = None
 
-class ScheduleCreate(BaseModel):
+class ScheduleCreate(RequestModel):
     employee_id: uuid.UUID
     shift_id: Optional[uuid.UUID] = None
     date: date
-    start_time: str
-    end_time: str
+    start_time: time
+    end_time: time
     overtime_hours: Optional[float] = 0
     is_custom: Optional[bool] = False
 
-class ScheduleUpdate(BaseModel):
+class ScheduleUpdate(RequestModel):
     shift_id: Optional[uuid.UUID] = None
     start_time: Optional[str] = None
     end_time: Optional[str] = None
     overtime_hours: Optional[float] = None
 
-class ClockInRequest(BaseModel):
+class ClockInRequest(RequestModel):
     employee_id: uuid.UUID
     date: date
 
-class ClockOutRequest(BaseModel):
+class ClockOutRequest(RequestModel):
     employee_id: uuid.UUID
     date: date
 
-class OvertimeCreate(BaseModel):
+class OvertimeCreate(RequestModel):
     employee_id: uuid.UUID
     date: date
     actual_hours: float
     overtime_type: str
     compensation_mode: str
 
-class OvertimeApproval(BaseModel):
+class OvertimeApproval(RequestModel):
     approved_hours: Optional[float] = None
     approval_status: str
 
-class LeaveRequest(BaseModel):
+class OvertimeBatchItem(OvertimeApproval):
+    id: uuid.UUID
+
+class OvertimeBatchApproval(RequestModel):
+    items: List[OvertimeBatchItem]
+
+class LeaveRequest(RequestModel):
     employee_id: uuid.UUID
     leave_type: str
     date: date
     duration: str
     reason: Optional[str] = None
 
-class LeaveApproval(BaseModel):
+class LeaveApproval(RequestModel):
     approval_status: str
 
-class HolidayCreate(BaseModel):
+class LeaveBatchItem(LeaveApproval):
+    id: uuid.UUID
+
+class LeaveBatchApproval(RequestModel):
+    items: List[LeaveBatchItem]
+
+class HolidayCreate(RequestModel):
     name: str
     date: date
     holiday_type: str
     location: Optional[str] = None
     is_paid: Optional[bool] = True
 
-class ScheduleGenerateRequest(BaseModel):
+class HolidayBulkCreate(RequestModel):
+    items: List[HolidayCreate]
+
+class ScheduleGenerateRequest(RequestModel):
     role_id: uuid.UUID
     start_date: date
     end_date: date
     location: Optional[str] = None
 
+# ============================================================================
+# RESPONSE ROWS
+# ============================================================================
+# List endpoints build one of these per row instead of a dict; orjson
+# serializes slotted dataclasses natively (UUID/datetime included). They are
+# also the routes' response_model, which documents the shape in OpenAPI; the
+# handlers return an encoded Response, so FastAPI does not re-validate rows.
+
+@dataclass
+class DepartmentRow:
+    __slots__ = ("id", "name", "location", "created_at")
+    id: uuid.UUID
+    name: str
+    location: Optional[str]
+    created_at: Optional[datetime]
+
+@dataclass
+class ManagerRow:
+    __slots__ = ("id", "name", "username", "department_id", "department_name", "created_at")
+    id: uuid.UUID
+    name: str
+    username: str
+    department_id: uuid.UUID
+    department_name: Optional[str]
+    created_at: Optional[datetime]
+
+@dataclass
+class RoleRow:
+    __slots__ = (
+        "id", "name", "work_days", "break_minutes", "daily_work_hours", "weekly_hours_limit",
+        "daily_max_hours", "monthly_overtime_limit", "employment_type", "department_id"
+    )
+    id: uuid.UUID
+    name: str
+    work_days: Optional[list]
+    break_minutes: Optional[int]
+    daily_work_hours: Optional[float]
+    weekly_hours_limit: Optional[float]
+    daily_max_hours: Optional[float]
+    monthly_overtime_limit: Optional[float]
+    employment_type: Optional[str]
+    department_id: uuid.UUID
+
+@dataclass
+class ShiftRow:
+    __slots__ = (
+        "id", "role_id", "role_name", "name", "day_of_week", "start_time", "end_time",
+        "priority", "skills_required"
+    )
+    id: uuid.UUID
+    role_id: uuid.UUID
+    role_name: Optional[str]
+    name: str
+    day_of_week: int
+    start_time: Optional[time]
+    end_time: Optional[time]
+    priority: Optional[int]
+    skills_required: Optional[list]
+
+@dataclass
+class EmployeeRow:
+    __slots__ = (
+        "id", "name", "username", "role_id", "role_name", "is_active", "monthly_overtime_used",
+        "yearly_paid_leave_allowance", "yearly_paid_leave_used", "skills", "availability"
+    )
+    id: uuid.UUID
+    name: str
+    username: str
+    role_id: uuid.UUID
+    role_name: Optional[str]
+    is_active: Optional[bool]
+    monthly_overtime_used: float
+    yearly_paid_leave_allowance: Optional[int]
+    yearly_paid_leave_used: Optional[int]
+    skills: Optional[list]
+    availability: Optional[dict]
+
+@dataclass
+class ScheduleRow:
+    __slots__ = (
+        "id", "employee_id", "employee_name", "shift_id", "shift_name", "date", "start_time",
+        "end_time", "overtime_hours", "is_custom"
+    )
+    id: uuid.UUID
+    employee_id: uuid.UUID
+    employee_name: str
+    shift_id: Optional[uuid.UUID]
+    shift_name: Optional[str]
+    date: date
+    start_time: time
+    end_time: time
+    overtime_hours: float
+    is_custom: Optional[bool]
+
+@dataclass
+class AttendanceRow:
+    __slots__ = (
+        "id", "employee_id", "employee_name", "date", "scheduled_start", "scheduled_end",
+        "clock_in", "clock_out", "worked_hours", "overtime_hours", "status"
+    )
+    id: uuid.UUID
+    employee_id: uuid.UUID
+    employee_name: str
+    date: date
+    scheduled_start: Optional[time]
+    scheduled_end: Optional[time]
+    clock_in: Optional[time]
+    clock_out: Optional[time]
+    worked_hours: float
+    overtime_hours: float
+    status: Optional[str]
+
+@dataclass
+class OvertimeRow:
+    __slots__ = (
+        "id", "employee_id", "employee_name", "date", "actual_hours", "approved_hours",
+        "overtime_type", "compensation_mode", "approval_status", "created_at"
+    )
+    id: uuid.UUID
+    employee_id: uuid.UUID
+    employee_name: str
+    date: date
+    actual_hours: float
+    approved_hours: Optional[float]
+    overtime_type: Optional[str]
+    compensation_mode: Optional[str]
+    approval_status: Optional[str]
+    created_at: Optional[datetime]
+
+@dataclass
+class LeaveRow:
+    __slots__ = (
+        "id", "employee_id", "employee_name", "leave_type", "date", "duration", "reason",
+        "approval_status", "created_at"
+    )
+    id: uuid.UUID
+    employee_id: uuid.UUID
+    employee_name: str
+    leave_type: Optional[str]
+    date: date
+    duration: Optional[str]
+    reason: Optional[str]
+    approval_status: Optional[str]
+    created_at: Optional[datetime]
+
+@dataclass
+class HolidayRow:
+    __slots__ = ("id", "name", "date", "holiday_type", "location", "is_paid")
+    id: uuid.UUID
+    name: str
+    date: date
+    holiday_type: Optional[str]
+    location: Optional[str]
+    is_paid: Optional[bool]
+
+@dataclass
+class EmployeeScheduleRow:
+    __slots__ = (
+        "id", "shift_name", "date", "start_time", "end_time", "overtime_hours", "is_custom"
+    )
+    id: uuid.UUID
+    shift_name: str
+    date: date
+    start_time: time
+    end_time: time
+    overtime_hours: float
+    is_custom: Optional[bool]
+
+@dataclass
+class EmployeeAttendanceRow:
+    __slots__ = (
+        "date", "scheduled_start", "scheduled_end", "clock_in", "clock_out", "worked_hours",
+        "overtime_hours", "status"
+    )
+    date: date
+    scheduled_start: Optional[time]
+    scheduled_end: Optional[time]
+    clock_in: Optional[time]
+    clock_out: Optional[time]
+    worked_hours: float
+    overtime_hours: float
+    status: Optional[str]
+
+@dataclass
+class EmployeeOvertimeRow:
+    __slots__ = (
+        "id", "date", "actual_hours", "approved_hours", "overtime_type", "compensation_mode",
+        "approval_status"
+    )
+    id: uuid.UUID
+    date: date
+    actual_hours: float
+    approved_hours: Optional[float]
+    overtime_type: Optional[str]
+    compensation_mode: Optional[str]
+    approval_status: Optional[str]
+
+@dataclass
+class EmployeeLeaveRow:
+    __slots__ = ("id", "leave_type", "date", "duration", "reason", "approval_status")
+    id: uuid.UUID
+    leave_type: Optional[str]
+    date: date
+    duration: Optional[str]
+    reason: Optional[str]
+    approval_status: Optional[str]
+
 # ============================================================================
 # AUTHENTICATION DEPENDENCY
 # ============================================================================
+# These only verify the JWT and read its claims (no I/O), so they are async
+# and run inline on the event loop instead of taking a threadpool hop each
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
     payload = decode_token(token)
-    if payload is None:
+    if payload is None or "user_type" not in payload or "user_id" not in payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+    # Parse the id claims once here so handlers get UUIDs directly
+    try:
+        payload["user_id"] = uuid.UUID(payload["user_id"])
+        if "department_id" in payload:
+            payload["department_id"] = uuid.UUID(payload["department_id"])
+    except (TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials"
         )
     return payload
 
+async def require_admin(current_user: dict = Depends(get_current_user)) -> uuid.UUID:
+    """Authorize an admin and return their id from the token claims"""
+    if current_user["user_type"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return current_user["user_id"]
+
+def require_manager(current_user: dict = Depends(get_current_user)) -> uuid.UUID:
+    """Authorize a manager and return their department id from the token claims"""
+    if current_user["user_type"] != "manager":
+        raise HTTPException(status_code=403, detail="Manager access required")
+    department_id = current_user.get("department_id")
+    if department_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+    # The department claim goes stale when an admin moves or deletes the
+    # manager; those writes revoke earlier tokens (sync def: may hit Redis)
+    revoked_before = sessions_revoked_before(current_user["user_id"])
+    if revoked_before is not None and current_user.get("iat", 0) < revoked_before:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session revoked, please log in again"
+        )
+    return department_id
+
+async def require_employee(current_user: dict = Depends(get_current_user)) -> uuid.UUID:
+    """Authorize an employee and return their id from the token claims"""
+    if current_user["user_type"] != "employee":
+        raise HTTPException(status_code=403, detail="Employee access required")
+    return current_user["user_id"]
+
+def elapsed_hours(start, end):
+    """SQL expression for the hours from start to end (TIME values), wrapping past midnight"""
+    seconds = extract("epoch", end) - extract("epoch", start)
+    return case((seconds < 0, seconds + 86400), else_=seconds) / 3600
+
+def pending_first(approval_status):
+    """ORDER BY key that puts PENDING requests ahead of decided ones"""
+    return case((approval_status == 'PENDING', 0), else_=1)
+
+def role_in_department(db: Session, role_id: uuid.UUID, department_id: uuid.UUID) -> bool:
+    """Check that a role belongs to the department without loading the row"""
+    return db.query(
+        exists().where(Role.id == role_id, Role.department_id == department_id)
+    ).scalar()
+
+def employee_in_department(db: Session, employee_id: uuid.UUID, department_id: uuid.UUID) -> bool:
+    """Check that an employee belongs to the department without loading the row"""
+    return db.query(
+        exists().where(
+            Employee.id == employee_id,
+            Employee.role_id == Role.id,
+            Role.department_id == department_id
+        )
+    ).scalar()
+
 # ============================================================================
 # AUTH ROUTES
 # ============================================================================
@@ -217,13 +565,19 @@ def login(request: LoginRequest, db: Session = Depends(get_db)):
             detail="Incorrect username or password"
         )
     
+    # Everything the route dependencies need travels in the signed token, so
+    # authenticating a request never touches the database
+    claims = {
+        "sub": str(user.id),
+        "user_type": user_type,
+        "user_id": str(user.id)
+    }
+    if user_type == "manager":
+        claims["department_id"] = str(user.department_id)
+    
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={
-            "sub": user.username,
-            "user_type": user_type,
-            "user_id": str(user.id)
-        },
+        data=claims,
         expires_delta=access_token_expires
     )
     
@@ -238,8 +592,7 @@ def login(request: LoginRequest, db: Session = Depends(get_db)):
 @app.post("/api/auth/init-admin")
 def init_admin(db: Session = Depends(get_db)):
     """Initialize default admin user"""
-    existing = db.query(Admin).filter(Admin.username == "admin").first()
-    if existing:
+    if db.query(exists().where(Admin.username == "admin")).scalar():
         return {"message": "Admin already exists"}
     
     admin = Admin(
@@ -256,34 +609,22 @@ def init_admin(db: Session = Depends(get_db)):
 # ADMIN ROUTES - Departments
 # ============================================================================
 
-@app.get("/api/admin/departments")
+@app.get("/api/admin/departments", response_model=List[DepartmentRow])
 def get_departments(
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    departments = db.query(Department).all()
-    return [
-        {
-            "id": str(d.id),
-            "name": d.name,
-            "location": d.location,
-            "created_at": d.created_at.isoformat() if d.created_at else None
-        }
-        for d in departments
-    ]
+    return cached_json_response("departments", lambda: [
+        DepartmentRow(d.id, d.name, d.location, d.created_at)
+        for d in db.query(Department).options(*list_load_options()).all()
+    ])
 
 @app.post("/api/admin/departments")
 def create_department(
     data: DepartmentCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
     department = Department(
         id=uuid.uuid4(),
         name=data.name,
@@ -291,6 +632,7 @@ def create_department(
     )
     db.add(department)
     db.commit()
+    invalidate("departments")
     db.refresh(department)
     
     return {
@@ -304,22 +646,21 @@ def update_department(
     department_id: uuid.UUID,
     data: DepartmentUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    department = db.query(Department).filter(Department.id == department_id).first()
+    department = db.get(Department, department_id)
     if not department:
         raise HTTPException(status_code=404, detail="Department not found")
     
-    if data.name:
+    if data.name is not None:
         department.name = data.name
-    if data.location:
+    if data.location is not None:
         department.location = data.location
     
-    db.commit()
-    db.refresh(department)
+    if db.is_modified(department):
+        db.commit()
+        invalidate("departments")
+        db.refresh(department)
     
     return {
         "id": str(department.id),
@@ -331,17 +672,15 @@ def update_department(
 def delete_department(
     department_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    department = db.query(Department).filter(Department.id == department_id).first()
+    department = db.get(Department, department_id)
     if not department:
         raise HTTPException(status_code=404, detail="Department not found")
     
     db.delete(department)
     db.commit()
+    invalidate("departments")
     
     return {"message": "Department deleted"}
 
@@ -349,39 +688,32 @@ def delete_department(
 # ADMIN ROUTES - Managers
 # ============================================================================
 
-@app.get("/api/admin/managers")
+@app.get("/api/admin/managers", response_model=List[ManagerRow])
 def get_managers(
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    managers = db.query(Manager).all()
-    return [
-        {
-            "id": str(m.id),
-            "name": m.name,
-            "username": m.username,
-            "department_id": str(m.department_id),
-            "department_name": m.department.name if m.department else None,
-            "created_at": m.created_at.isoformat() if m.created_at else None
-        }
+    managers = db.query(Manager).options(*list_load_options(joinedload(Manager.department))).all()
+    return ORJSONResponse([
+        ManagerRow(
+            m.id,
+            m.name,
+            m.username,
+            m.department_id,
+            m.department.name if m.department else None,
+            m.created_at
+        )
         for m in managers
-    ]
+    ])
 
 @app.post("/api/admin/managers")
 def create_manager(
     data: ManagerCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
     # Check if username exists
-    existing = db.query(Manager).filter(Manager.username == data.username).first()
-    if existing:
+    if db.query(exists().where(Manager.username == data.username)).scalar():
         raise HTTPException(status_code=400, detail="Username already exists")
     
     manager = Manager(
@@ -407,26 +739,32 @@ def update_manager(
     manager_id: uuid.UUID,
     data: ManagerUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    manager = db.query(Manager).filter(Manager.id == manager_id).first()
+    manager = db.get(Manager, manager_id)
     if not manager:
         raise HTTPException(status_code=404, detail="Manager not found")
     
-    if data.name:
+    # Tokens carry the department, so a move or a new password ends the
+    # manager's existing sessions
+    revoke = bool(data.password) or (
+        data.department_id is not None and data.department_id != manager.department_id
+    )
+    
+    if data.name is not None:
         manager.name = data.name
-    if data.username:
+    if data.username is not None:
         manager.username = data.username
     if data.password:
         manager.password_hash = get_password_hash(data.password)
-    if data.department_id:
+    if data.department_id is not None:
         manager.department_id = data.department_id
     
-    db.commit()
-    db.refresh(manager)
+    if db.is_modified(manager):
+        db.commit()
+        db.refresh(manager)
+    if revoke:
+        revoke_sessions(manager.id, ACCESS_TOKEN_EXPIRE_MINUTES * 60)
     
     return {
         "id": str(manager.id),
@@ -439,17 +777,15 @@ def update_manager(
 def delete_manager(
     manager_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    admin_id: uuid.UUID = Depends(require_admin)
 ):
-    if current_user["user_type"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    manager = db.query(Manager).filter(Manager.id == manager_id).first()
+    manager = db.get(Manager, manager_id)
     if not manager:
         raise HTTPException(status_code=404, detail="Manager not found")
     
     db.delete(manager)
     db.commit()
+    revoke_sessions(manager_id, ACCESS_TOKEN_EXPIRE_MINUTES * 60)
     
     return {"message": "Manager deleted"}
 
@@ -457,44 +793,34 @@ def delete_manager(
 # MANAGER ROUTES - Roles
 # ============================================================================
 
-@app.get("/api/manager/roles")
+@app.get("/api/manager/roles", response_model=List[RoleRow])
 def get_roles(
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    roles = db.query(Role).filter(Role.department_id == manager.department_id).all()
-    
-    return [
-        {
-            "id": str(r.id),
-            "name": r.name,
-            "work_days": r.work_days,
-            "break_minutes": r.break_minutes,
-            "daily_work_hours": float(r.daily_work_hours) if r.daily_work_hours else None,
-            "weekly_hours_limit": float(r.weekly_hours_limit) if r.weekly_hours_limit else None,
-            "daily_max_hours": float(r.daily_max_hours) if r.daily_max_hours else None,
-            "monthly_overtime_limit": float(r.monthly_overtime_limit) if r.monthly_overtime_limit else None,
-            "employment_type": r.employment_type,
-            "department_id": str(r.department_id)
-        }
-        for r in roles
-    ]
+    return cached_json_response(f"roles:{department_id}", lambda: [
+        RoleRow(
+            r.id,
+            r.name,
+            r.work_days,
+            r.break_minutes,
+            float(r.daily_work_hours) if r.daily_work_hours else None,
+            float(r.weekly_hours_limit) if r.weekly_hours_limit else None,
+            float(r.daily_max_hours) if r.daily_max_hours else None,
+            float(r.monthly_overtime_limit) if r.monthly_overtime_limit else None,
+            r.employment_type,
+            r.department_id
+        )
+        for r in db.query(Role).options(*list_load_options()).filter(Role.department_id == department_id).all()
+    ])
 
 @app.post("/api/manager/roles")
 def create_role(
     data: RoleCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    if str(data.department_id) != str(manager.department_id):
+    if data.department_id != department_id:
         raise HTTPException(status_code=403, detail="Can only create roles in your department")
     
     role = Role(
@@ -511,6 +837,7 @@ def create_role(
     )
     db.add(role)
     db.commit()
+    invalidate(f"roles:{department_id}")
     db.refresh(role)
     
     return {"id": str(role.id), "name": role.name}
@@ -520,20 +847,19 @@ def update_role(
     role_id: uuid.UUID,
     data: RoleUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    role = db.query(Role).filter(Role.id == role_id).first()
+    role = db.query(Role).filter(
+        Role.id == role_id,
+        Role.department_id == department_id
+    ).first()
     
-    if not role or str(role.department_id) != str(manager.department_id):
+    if not role:
         raise HTTPException(status_code=404, detail="Role not found in your department")
     
-    if data.name:
+    if data.name is not None:
         role.name = data.name
-    if data.work_days:
+    if data.work_days is not None:
         role.work_days = data.work_days
     if data.break_minutes is not None:
         role.break_minutes = data.break_minutes
@@ -545,11 +871,13 @@ def update_role(
         role.daily_max_hours = data.daily_max_hours
     if data.monthly_overtime_limit is not None:
         role.monthly_overtime_limit = data.monthly_overtime_limit
-    if data.employment_type:
+    if data.employment_type is not None:
         role.employment_type = data.employment_type
     
-    db.commit()
-    db.refresh(role)
+    if db.is_modified(role):
+        db.commit()
+        invalidate(f"roles:{department_id}")
+        db.refresh(role)
     
     return {"id": str(role.id), "name": role.name}
 
@@ -557,19 +885,19 @@ def update_role(
 def delete_role(
     role_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    role = db.query(Role).filter(Role.id == role_id).first()
+    role = db.query(Role).filter(
+        Role.id == role_id,
+        Role.department_id == department_id
+    ).first()
     
-    if not role or str(role.department_id) != str(manager.department_id):
+    if not role:
         raise HTTPException(status_code=404, detail="Role not found")
     
     db.delete(role)
     db.commit()
+    invalidate(f"roles:{department_id}")
     
     return {"message": "Role deleted"}
 
@@ -577,51 +905,42 @@ def delete_role(
 # MANAGER ROUTES - Shifts
 # ============================================================================
 
-@app.get("/api/manager/shifts")
+@app.get("/api/manager/shifts", response_model=List[ShiftRow])
 def get_shifts(
     role_id: Optional[uuid.UUID] = None,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    
-    query = db.query(Shift).join(Role).filter(Role.department_id == manager.department_id)
+    query = db.query(Shift).join(Role).options(*list_load_options(contains_eager(Shift.role))).filter(
+        Role.department_id == department_id
+    )
     if role_id:
         query = query.filter(Shift.role_id == role_id)
     
     shifts = query.all()
     
-    return [
-        {
-            "id": str(s.id),
-            "role_id": str(s.role_id),
-            "role_name": s.role.name if s.role else None,
-            "name": s.name,
-            "day_of_week": s.day_of_week,
-            "start_time": s.start_time.isoformat() if s.start_time else None,
-            "end_time": s.end_time.isoformat() if s.end_time else None,
-            "priority": s.priority,
-            "skills_required": s.skills_required
-        }
+    return ORJSONResponse([
+        ShiftRow(
+            s.id,
+            s.role_id,
+            s.role.name if s.role else None,
+            s.name,
+            s.day_of_week,
+            s.start_time,
+            s.end_time,
+            s.priority,
+            s.skills_required
+        )
         for s in shifts
-    ]
+    ])
 
 @app.post("/api/manager/shifts")
 def create_shift(
     data: ShiftCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    role = db.query(Role).filter(Role.id == data.role_id).first()
-    
-    if not role or str(role.department_id) != str(manager.department_id):
+    if not role_in_department(db, data.role_id, department_id):
         raise HTTPException(status_code=403, detail="Role not in your department")
     
     shift = Shift(
@@ -629,8 +948,8 @@ def create_shift(
         role_id=data.role_id,
         name=data.name,
         day_of_week=data.day_of_week,
-        start_time=datetime.strptime(data.start_time, "%H:%M").time(),
-        end_time=datetime.strptime(data.end_time, "%H:%M").time(),
+        start_time=data.start_time,
+        end_time=data.end_time,
         priority=data.priority,
         skills_required=data.skills_required
     )
@@ -645,35 +964,32 @@ def update_shift(
     shift_id: uuid.UUID,
     data: ShiftUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
     shift = db.query(Shift).join(Role).filter(
         Shift.id == shift_id,
-        Role.department_id == manager.department_id
+        Role.department_id == department_id
     ).first()
     
     if not shift:
         raise HTTPException(status_code=404, detail="Shift not found")
     
-    if data.name:
+    if data.name is not None:
         shift.name = data.name
     if data.day_of_week is not None:
         shift.day_of_week = data.day_of_week
-    if data.start_time:
-        shift.start_time = datetime.strptime(data.start_time, "%H:%M").time()
-    if data.end_time:
-        shift.end_time = datetime.strptime(data.end_time, "%H:%M").time()
+    if data.start_time is not None:
+        shift.start_time = data.start_time
+    if data.end_time is not None:
+        shift.end_time = data.end_time
     if data.priority is not None:
         shift.priority = data.priority
     if data.skills_required is not None:
         shift.skills_required = data.skills_required
     
-    db.commit()
-    db.refresh(shift)
+    if db.is_modified(shift):
+        db.commit()
+        db.refresh(shift)
     
     return {"id": str(shift.id), "name": shift.name}
 
@@ -681,15 +997,11 @@ def update_shift(
 def delete_shift(
     shift_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
     shift = db.query(Shift).join(Role).filter(
         Shift.id == shift_id,
-        Role.department_id == manager.department_id
+        Role.department_id == department_id
     ).first()
     
     if not shift:
@@ -704,54 +1016,43 @@ def delete_shift(
 # MANAGER ROUTES - Employees
 # ============================================================================
 
-@app.get("/api/manager/employees")
+@app.get("/api/manager/employees", response_model=List[EmployeeRow])
 def get_employees(
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    employees = db.query(Employee).join(Role).filter(
-        Role.department_id == manager.department_id
+    employees = db.query(Employee).join(Role).options(*list_load_options(contains_eager(Employee.role))).filter(
+        Role.department_id == department_id
     ).all()
     
-    return [
-        {
-            "id": str(e.id),
-            "name": e.name,
-            "username": e.username,
-            "role_id": str(e.role_id),
-            "role_name": e.role.name if e.role else None,
-            "is_active": e.is_active,
-            "monthly_overtime_used": float(e.monthly_overtime_used) if e.monthly_overtime_used else 0,
-            "yearly_paid_leave_allowance": e.yearly_paid_leave_allowance,
-            "yearly_paid_leave_used": e.yearly_paid_leave_used,
-            "skills": e.skills,
-            "availability": e.availability
-        }
+    return ORJSONResponse([
+        EmployeeRow(
+            e.id,
+            e.name,
+            e.username,
+            e.role_id,
+            e.role.name if e.role else None,
+            e.is_active,
+            float(e.monthly_overtime_used) if e.monthly_overtime_used else 0,
+            e.yearly_paid_leave_allowance,
+            e.yearly_paid_leave_used,
+            e.skills,
+            e.availability
+        )
         for e in employees
-    ]
+    ])
 
 @app.post("/api/manager/employees")
 def create_employee(
     data: EmployeeCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    role = db.query(Role).filter(Role.id == data.role_id).first()
-    
-    if not role or str(role.department_id) != str(manager.department_id):
+    if not role_in_department(db, data.role_id, department_id):
         raise HTTPException(status_code=403, detail="Role not in your department")
     
     # Check if username exists
-    existing = db.query(Employee).filter(Employee.username == data.username).first()
-    if existing:
+    if db.query(exists().where(Employee.username == data.username)).scalar():
         raise HTTPException(status_code=400, detail="Username already exists")
     
     employee = Employee(
@@ -775,29 +1076,24 @@ def update_employee(
     employee_id: uuid.UUID,
     data: EmployeeUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
     employee = db.query(Employee).join(Role).filter(
         Employee.id == employee_id,
-        Role.department_id == manager.department_id
+        Role.department_id == department_id
     ).first()
     
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
-    if data.role_id:
-        role = db.query(Role).filter(Role.id == data.role_id).first()
-        if not role or str(role.department_id) != str(manager.department_id):
+    if data.role_id is not None:
+        if not role_in_department(db, data.role_id, department_id):
             raise HTTPException(status_code=403, detail="Role not in your department")
         employee.role_id = data.role_id
     
-    if data.name:
+    if data.name is not None:
         employee.name = data.name
-    if data.username:
+    if data.username is not None:
         employee.username = data.username
     if data.password:
         employee.password_hash = get_password_hash(data.password)
@@ -810,8 +1106,9 @@ def update_employee(
     if data.is_active is not None:
         employee.is_active = data.is_active
     
-    db.commit()
-    db.refresh(employee)
+    if db.is_modified(employee):
+        db.commit()
+        db.refresh(employee)
     
     return {"id": str(employee.id), "name": employee.name}
 
@@ -819,15 +1116,11 @@ def update_employee(
 def delete_employee(
     employee_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
     employee = db.query(Employee).join(Role).filter(
         Employee.id == employee_id,
-        Role.department_id == manager.department_id
+        Role.department_id == department_id
     ).first()
     
     if not employee:
@@ -843,21 +1136,31 @@ def delete_employee(
 # MANAGER ROUTES - Schedules
 # ============================================================================
 
-@app.get("/api/manager/schedules")
+@app.get("/api/manager/schedules", response_model=List[ScheduleRow])
 def get_schedules(
     employee_id: Optional[uuid.UUID] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    
-    query = db.query(Schedule).join(Employee).join(Role).filter(
-        Role.department_id == manager.department_id
+    query = db.query(
+        Schedule.id,
+        Schedule.employee_id,
+        Employee.name.label("employee_name"),
+        Schedule.shift_id,
+        Shift.name.label("shift_name"),
+        Schedule.date,
+        Schedule.start_time,
+        Schedule.end_time,
+        Schedule.overtime_hours,
+        Schedule.is_custom
+    ).select_from(Schedule).join(Employee).join(Role, Employee.role_id == Role.id).outerjoin(
+        Shift, Schedule.shift_id == Shift.id
+    ).filter(
+        Role.department_id == department_id
     )
     
     if employee_id:
@@ -867,80 +1170,69 @@ def get_schedules(
     if end_date:
         query = query.filter(Schedule.date <= end_date)
     
-    schedules = query.all()
-    
-    return [
-        {
-            "id": str(s.id),
-            "employee_id": str(s.employee_id),
-            "employee_name": s.employee.name if s.employee else None,
-            "shift_id": str(s.shift_id) if s.shift_id else None,
-            "shift_name": s.shift.name if s.shift else None,
-            "date": s.date.isoformat(),
-            "start_time": s.start_time.isoformat() if s.start_time else None,
-            "end_time": s.end_time.isoformat() if s.end_time else None,
-            "overtime_hours": float(s.overtime_hours) if s.overtime_hours else 0,
-            "is_custom": s.is_custom
-        }
+    schedules = query.order_by(Schedule.date.desc(), Schedule.id).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        ScheduleRow(
+            s.id,
+            s.employee_id,
+            s.employee_name,
+            s.shift_id,
+            s.shift_name,
+            s.date,
+            s.start_time,
+            s.end_time,
+            float(s.overtime_hours) if s.overtime_hours else 0,
+            s.is_custom
+        )
         for s in schedules
-    ]
+    ], limit, offset)
 
 @app.post("/api/manager/schedules")
 def create_schedule(
     data: ScheduleCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    employee = db.query(Employee).join(Role).filter(
-        Employee.id == data.employee_id,
-        Role.department_id == manager.department_id
-    ).first()
-    
-    if not employee:
+    if not employee_in_department(db, data.employee_id, department_id):
         raise HTTPException(status_code=404, detail="Employee not found")
     
-    # Check if schedule already exists
-    existing = db.query(Schedule).filter(
-        Schedule.employee_id == data.employee_id,
-        Schedule.date == data.date
-    ).first()
-    
-    if existing:
+    # Insert unless the employee is already scheduled that day (uq_schedule_employee_date)
+    schedule_id = db.execute(
+        pg_insert(Schedule).values(
+            id=uuid.uuid4(),
+            employee_id=data.employee_id,
+            shift_id=data.shift_id,
+            date=data.date,
+            start_time=data.start_time,
+            end_time=data.end_time,
+            overtime_hours=data.overtime_hours,
+            is_custom=data.is_custom
+        ).on_conflict_do_nothing(
+            index_elements=[Schedule.employee_id, Schedule.date]
+        ).returning(Schedule.id)
+    ).scalar()
+    
+    if schedule_id is None:
         raise HTTPException(status_code=400, detail="Schedule already exists for this date")
     
-    schedule = Schedule(
-        id=uuid.uuid4(),
-        employee_id=data.employee_id,
-        shift_id=data.shift_id,
-        date=data.date,
-        start_time=datetime.strptime(data.start_time, "%H:%M").time(),
-        end_time=datetime.strptime(data.end_time, "%H:%M").time(),
-        overtime_hours=data.overtime_hours,
-        is_custom=data.is_custom
-    )
-    db.add(schedule)
     db.commit()
-    db.refresh(schedule)
     
-    return {"id": str(schedule.id), "date": schedule.date.isoformat()}
+    return {"id": str(schedule_id), "date": data.date.isoformat()}
 
 @app.post("/api/manager/schedules/generate")
 def generate_schedules(
     data: ScheduleGenerateRequest,
+    details: bool = Query(True),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    role = db.query(Role).filter(Role.id == data.role_id).first()
+    role = db.query(Role).filter(
+        Role.id == data.role_id,
+        Role.department_id == department_id
+    ).first()
     
-    if not role or str(role.department_id) != str(manager.department_id):
+    if not role:
         raise HTTPException(status_code=403, detail="Role not in your department")
     
     scheduler = ShiftScheduler(db)
@@ -948,30 +1240,32 @@ def generate_schedules(
         data.role_id,
         data.start_date,
         data.end_date,
-        data.location
+        data.location,
+        include_details=details
     )
     
-    return result
+    return ORJSONResponse(result)
 
 @app.delete("/api/manager/schedules/{schedule_id}")
 def delete_schedule(
     schedule_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    schedule = db.query(Schedule).join(Employee).join(Role).filter(
-        Schedule.id == schedule_id,
-        Role.department_id == manager.department_id
-    ).first()
+    # Schedules have no dependent rows, so delete in one scoped statement
+    # instead of loading the row first
+    result = db.execute(
+        delete(Schedule).where(
+            Schedule.id == schedule_id,
+            Schedule.employee_id.in_(
+                select(Employee.id).join(Role).where(Role.department_id == department_id)
+            )
+        )
+    )
     
-    if not schedule:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Schedule not found")
     
-    db.delete(schedule)
     db.commit()
     
     return {"message": "Schedule deleted"}
@@ -980,21 +1274,30 @@ def delete_schedule(
 # MANAGER ROUTES - Attendance
 # ============================================================================
 
-@app.get("/api/manager/attendance")
+@app.get("/api/manager/attendance", response_model=List[AttendanceRow])
 def get_attendance(
     employee_id: Optional[uuid.UUID] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    
-    query = db.query(Attendance).join(Employee).join(Role).filter(
-        Role.department_id == manager.department_id
+    query = db.query(
+        Attendance.id,
+        Attendance.employee_id,
+        Employee.name.label("employee_name"),
+        Attendance.date,
+        Attendance.scheduled_start,
+        Attendance.scheduled_end,
+        Attendance.clock_in,
+        Attendance.clock_out,
+        Attendance.worked_hours,
+        Attendance.overtime_hours,
+        Attendance.status
+    ).select_from(Attendance).join(Employee).join(Role).filter(
+        Role.department_id == department_id
     )
     
     if employee_id:
@@ -1004,78 +1307,71 @@ def get_attendance(
     if end_date:
         query = query.filter(Attendance.date <= end_date)
     
-    attendances = query.all()
-    
-    return [
-        {
-            "id": str(a.id),
-            "employee_id": str(a.employee_id),
-            "employee_name": a.employee.name if a.employee else None,
-            "date": a.date.isoformat(),
-            "scheduled_start": a.scheduled_start.isoformat() if a.scheduled_start else None,
-            "scheduled_end": a.scheduled_end.isoformat() if a.scheduled_end else None,
-            "clock_in": a.clock_in.isoformat() if a.clock_in else None,
-            "clock_out": a.clock_out.isoformat() if a.clock_out else None,
-            "worked_hours": float(a.worked_hours) if a.worked_hours else 0,
-            "overtime_hours": float(a.overtime_hours) if a.overtime_hours else 0,
-            "status": a.status
-        }
+    attendances = query.order_by(Attendance.date.desc(), Attendance.id).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        AttendanceRow(
+            a.id,
+            a.employee_id,
+            a.employee_name,
+            a.date,
+            a.scheduled_start,
+            a.scheduled_end,
+            a.clock_in,
+            a.clock_out,
+            float(a.worked_hours) if a.worked_hours else 0,
+            float(a.overtime_hours) if a.overtime_hours else 0,
+            a.status
+        )
         for a in attendances
-    ]
+    ], limit, offset)
 
 # ============================================================================
 # MANAGER ROUTES - Overtime Approval
 # ============================================================================
 
-@app.get("/api/manager/overtime")
+@app.get("/api/manager/overtime", response_model=List[OvertimeRow])
 def get_overtime_requests(
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    
-    overtimes = db.query(Overtime).join(Employee).join(Role).filter(
-        Role.department_id == manager.department_id
-    ).all()
-    
-    return [
-        {
-            "id": str(o.id),
-            "employee_id": str(o.employee_id),
-            "employee_name": o.employee.name if o.employee else None,
-            "date": o.date.isoformat(),
-            "actual_hours": float(o.actual_hours),
-            "approved_hours": float(o.approved_hours) if o.approved_hours else None,
-            "overtime_type": o.overtime_type,
-            "compensation_mode": o.compensation_mode,
-            "approval_status": o.approval_status,
-            "created_at": o.created_at.isoformat() if o.created_at else None
-        }
+    overtimes = db.query(
+        Overtime.id,
+        Overtime.employee_id,
+        Employee.name.label("employee_name"),
+        Overtime.date,
+        Overtime.actual_hours,
+        Overtime.approved_hours,
+        Overtime.overtime_type,
+        Overtime.compensation_mode,
+        Overtime.approval_status,
+        Overtime.created_at
+    ).select_from(Overtime).join(Employee).join(Role).filter(
+        Role.department_id == department_id
+    ).order_by(
+        pending_first(Overtime.approval_status), Overtime.date.desc(), Overtime.id
+    ).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        OvertimeRow(
+            o.id,
+            o.employee_id,
+            o.employee_name,
+            o.date,
+            float(o.actual_hours),
+            float(o.approved_hours) if o.approved_hours else None,
+            o.overtime_type,
+            o.compensation_mode,
+            o.approval_status,
+            o.created_at
+        )
         for o in overtimes
-    ]
+    ], limit, offset)
 
-@app.put("/api/manager/overtime/{overtime_id}/approve")
-def approve_overtime(
-    overtime_id: uuid.UUID,
-    data: OvertimeApproval,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
-):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
-    overtime = db.query(Overtime).join(Employee).join(Role).filter(
-        Overtime.id == overtime_id,
-        Role.department_id == manager.department_id
-    ).first()
-    
-    if not overtime:
-        raise HTTPException(status_code=404, detail="Overtime request not found")
-    
+def apply_overtime_approval(db: Session, overtime: Overtime, data: OvertimeApproval):
+    """Apply a manager decision to a loaded overtime request (caller commits)"""
     overtime.approval_status = data.approval_status
     if data.approved_hours is not None:
         overtime.approved_hours = data.approved_hours
@@ -1097,75 +1393,149 @@ def approve_overtime(
         )
         db.add(comp_off)
     
-    # Update employee overtime usage if EXTRA_PAY
+    # Update employee overtime usage if EXTRA_PAY (atomic increment, no row load)
     if data.approval_status == "APPROVED" and overtime.compensation_mode == "EXTRA_PAY":
-        employee = overtime.employee
-        employee.monthly_overtime_used = (employee.monthly_overtime_used or 0) + overtime.approved_hours
+        db.execute(
+            update(Employee).where(Employee.id == overtime.employee_id).values(
+                monthly_overtime_used=func.coalesce(Employee.monthly_overtime_used, 0) + overtime.approved_hours
+            )
+        )
+
+@app.put("/api/manager/overtime/batch-approve")
+def batch_approve_overtime(
+    data: OvertimeBatchApproval,
+    db: Session = Depends(get_db),
+    department_id: uuid.UUID = Depends(require_manager)
+):
+    decisions = {item.id: item for item in data.items}
+    overtimes = db.query(Overtime).join(Employee).join(Role).filter(
+        Overtime.id.in_(decisions),
+        Role.department_id == department_id
+    ).all()
+    
+    if len(overtimes) != len(decisions):
+        raise HTTPException(status_code=404, detail="Overtime request not found")
+    
+    for overtime in overtimes:
+        apply_overtime_approval(db, overtime, decisions[overtime.id])
     
     db.commit()
     
+    return {"message": "Overtime requests processed", "processed": len(overtimes)}
+
+@app.put("/api/manager/overtime/{overtime_id}/approve")
+def approve_overtime(
+    overtime_id: uuid.UUID,
+    data: OvertimeApproval,
+    db: Session = Depends(get_db),
+    department_id: uuid.UUID = Depends(require_manager)
+):
+    overtime = db.query(Overtime).join(Employee).join(Role).filter(
+        Overtime.id == overtime_id,
+        Role.department_id == department_id
+    ).first()
+    
+    if not overtime:
+        raise HTTPException(status_code=404, detail="Overtime request not found")
+    
+    apply_overtime_approval(db, overtime, data)
+    db.commit()
+    
     return {"message": "Overtime request processed"}
 
 # ============================================================================
 # MANAGER ROUTES - Leave Approval
 # ============================================================================
 
-@app.get("/api/manager/leaves")
+@app.get("/api/manager/leaves", response_model=List[LeaveRow])
 def get_leave_requests(
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
+    leaves = db.query(
+        EmployeeLeave.id,
+        EmployeeLeave.employee_id,
+        Employee.name.label("employee_name"),
+        EmployeeLeave.leave_type,
+        EmployeeLeave.date,
+        EmployeeLeave.duration,
+        EmployeeLeave.reason,
+        EmployeeLeave.approval_status,
+        EmployeeLeave.created_at
+    ).select_from(EmployeeLeave).join(Employee).join(Role).filter(
+        Role.department_id == department_id
+    ).order_by(
+        pending_first(EmployeeLeave.approval_status), EmployeeLeave.date.desc(), EmployeeLeave.id
+    ).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        LeaveRow(
+            l.id,
+            l.employee_id,
+            l.employee_name,
+            l.leave_type,
+            l.date,
+            l.duration,
+            l.reason,
+            l.approval_status,
+            l.created_at
+        )
+        for l in leaves
+    ], limit, offset)
+
+def apply_leave_approval(db: Session, leave: EmployeeLeave, data: LeaveApproval):
+    """Apply a manager decision to a loaded leave request (caller commits)"""
+    leave.approval_status = data.approval_status
     
+    # Update employee leave usage if approved (atomic increment, no row load)
+    if data.approval_status == "APPROVED" and leave.leave_type == "PAID":
+        increment = 1 if leave.duration == "FULL_DAY" else 0.5
+        db.execute(
+            update(Employee).where(Employee.id == leave.employee_id).values(
+                yearly_paid_leave_used=func.coalesce(Employee.yearly_paid_leave_used, 0) + increment
+            )
+        )
+
+@app.put("/api/manager/leaves/batch-approve")
+def batch_approve_leaves(
+    data: LeaveBatchApproval,
+    db: Session = Depends(get_db),
+    department_id: uuid.UUID = Depends(require_manager)
+):
+    decisions = {item.id: item for item in data.items}
     leaves = db.query(EmployeeLeave).join(Employee).join(Role).filter(
-        Role.department_id == manager.department_id
+        EmployeeLeave.id.in_(decisions),
+        Role.department_id == department_id
     ).all()
     
-    return [
-        {
-            "id": str(l.id),
-            "employee_id": str(l.employee_id),
-            "employee_name": l.employee.name if l.employee else None,
-            "leave_type": l.leave_type,
-            "date": l.date.isoformat(),
-            "duration": l.duration,
-            "reason": l.reason,
-            "approval_status": l.approval_status,
-            "created_at": l.created_at.isoformat() if l.created_at else None
-        }
-        for l in leaves
-    ]
+    if len(leaves) != len(decisions):
+        raise HTTPException(status_code=404, detail="Leave request not found")
+    
+    for leave in leaves:
+        apply_leave_approval(db, leave, decisions[leave.id])
+    
+    db.commit()
+    
+    return {"message": "Leave requests processed", "processed": len(leaves)}
 
 @app.put("/api/manager/leaves/{leave_id}/approve")
 def approve_leave(
     leave_id: uuid.UUID,
     data: LeaveApproval,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
-    
-    manager = db.query(Manager).filter(Manager.id == uuid.UUID(current_user["user_id"])).first()
     leave = db.query(EmployeeLeave).join(Employee).join(Role).filter(
         EmployeeLeave.id == leave_id,
-        Role.department_id == manager.department_id
+        Role.department_id == department_id
     ).first()
     
     if not leave:
         raise HTTPException(status_code=404, detail="Leave request not found")
     
-    leave.approval_status = data.approval_status
-    
-    # Update employee leave usage if approved
-    if data.approval_status == "APPROVED" and leave.leave_type == "PAID":
-        employee = leave.employee
-        increment = 1 if leave.duration == "FULL_DAY" else 0.5
-        employee.yearly_paid_leave_used = (employee.yearly_paid_leave_used or 0) + increment
-    
+    apply_leave_approval(db, leave, data)
     db.commit()
     
     return {"message": "Leave request processed"}
@@ -1174,84 +1544,143 @@ def approve_leave(
 # MANAGER ROUTES - Holidays
 # ============================================================================
 
-@app.get("/api/manager/holidays")
+@app.get("/api/manager/holidays", response_model=List[HolidayRow])
 def get_holidays(
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    holidays = db.query(Holiday).all()
-    return [
-        {
-            "id": str(h.id),
-            "name": h.name,
-            "date": h.date.isoformat(),
-            "holiday_type": h.holiday_type,
-            "location": h.location,
-            "is_paid": h.is_paid
-        }
-        for h in holidays
+    build = lambda: [
+        HolidayRow(
+            h.id,
+            h.name,
+            h.date,
+            h.holiday_type,
+            h.location,
+            h.is_paid
+        )
+        for h in db.query(
+            Holiday.id,
+            Holiday.name,
+            Holiday.date,
+            Holiday.holiday_type,
+            Holiday.location,
+            Holiday.is_paid
+        ).order_by(Holiday.date, Holiday.id).limit(limit + 1).offset(offset).all()
     ]
+    # Only the default first page is cached; holiday writes invalidate it
+    if limit == LIST_PAGE_LIMIT and offset == 0:
+        return cached_page_response("holidays", lambda: paginate(build(), limit, offset))
+    return paged_response(build(), limit, offset)
 
 @app.post("/api/manager/holidays")
 def create_holiday(
     data: HolidayCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    department_id: uuid.UUID = Depends(require_manager)
 ):
-    if current_user["user_type"] != "manager":
-        raise HTTPException(status_code=403, detail="Manager access required")
+    holiday = db.execute(
+        pg_insert(Holiday).values(
+            id=uuid.uuid4(),
+            name=data.name,
+            date=data.date,
+            holiday_type=data.holiday_type,
+            location=data.location,
+            is_paid=data.is_paid
+        ).on_conflict_do_nothing(index_elements=HOLIDAY_CONFLICT_TARGET).returning(Holiday.id, Holiday.name)
+    ).first()
+    
+    if holiday is None:
+        raise HTTPException(status_code=400, detail="Holiday already exists for this date and location")
     
-    holiday = Holiday(
-        id=uuid.uuid4(),
-        name=data.name,
-        date=data.date,
-        holiday_type=data.holiday_type,
-        location=data.location,
-        is_paid=data.is_paid
-    )
-    db.add(holiday)
     db.commit()
-    db.refresh(holiday)
+    invalidate("holidays")
     
     return {"id": str(holiday.id), "name": holiday.name}
 
+@app.post("/api/manager/holidays/bulk")
+def create_holidays_bulk(
+    data: HolidayBulkCreate,
+    db: Session = Depends(get_db),
+    department_id: uuid.UUID = Depends(require_manager)
+):
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": h.name,
+            "date": h.date,
+            "holiday_type": h.holiday_type,
+            "location": h.location,
+            "is_paid": h.is_paid
+        }
+        for h in data.items
+    ]
+    
+    # Skip holidays already defined for that date and location (uq_holiday_date_location;
+    # a NULL location counts as one location)
+    created = []
+    for i in range(0, len(rows), HOLIDAY_INSERT_BATCH_SIZE):
+        created.extend(db.execute(
+            pg_insert(Holiday).values(rows[i:i + HOLIDAY_INSERT_BATCH_SIZE]).on_conflict_do_nothing(
+                index_elements=HOLIDAY_CONFLICT_TARGET
+            ).returning(Holiday.id, Holiday.name)
+        ).all())
+    
+    db.commit()
+    if created:
+        invalidate("holidays")
+    
+    return {
+        "message": f"Created {len(created)} holidays",
+        "created": [{"id": str(h.id), "name": h.name} for h in created],
+        "skipped": len(rows) - len(created)
+    }
+
 # ============================================================================
 # EMPLOYEE ROUTES - Schedules
 # ============================================================================
 
-@app.get("/api/employee/schedules")
+@app.get("/api/employee/schedules", response_model=List[EmployeeScheduleRow])
 def get_employee_schedules(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    employee_id = uuid.UUID(current_user["user_id"])
-    
-    query = db.query(Schedule).filter(Schedule.employee_id == employee_id)
+    query = db.query(
+        Schedule.id,
+        Shift.name.label("shift_name"),
+        Schedule.date,
+        Schedule.start_time,
+        Schedule.end_time,
+        Schedule.overtime_hours,
+        Schedule.is_custom
+    ).select_from(Schedule).outerjoin(Shift, Schedule.shift_id == Shift.id).filter(
+        Schedule.employee_id == employee_id
+    )
     
     if start_date:
         query = query.filter(Schedule.date >= start_date)
     if end_date:
         query = query.filter(Schedule.date <= end_date)
     
-    schedules = query.all()
-    
-    return [
-        {
-            "id": str(s.id),
-            "shift_name": s.shift.name if s.shift else "Custom",
-            "date": s.date.isoformat(),
-            "start_time": s.start_time.isoformat() if s.start_time else None,
-            "end_time": s.end_time.isoformat() if s.end_time else None,
-            "overtime_hours": float(s.overtime_hours) if s.overtime_hours else 0,
-            "is_custom": s.is_custom
-        }
+    schedules = query.order_by(Schedule.date.desc(), Schedule.id).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        EmployeeScheduleRow(
+            s.id,
+            s.shift_name or "Custom",
+            s.date,
+            s.start_time,
+            s.end_time,
+            float(s.overtime_hours) if s.overtime_hours else 0,
+            s.is_custom
+        )
         for s in schedules
-    ]
+    ], limit, offset)
 
 # ============================================================================
 # EMPLOYEE ROUTES - Attendance (Clock In/Out)
@@ -1261,47 +1690,43 @@ def get_employee_schedules(
 def clock_in(
     data: ClockInRequest,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    if str(data.employee_id) != current_user["user_id"]:
+    if data.employee_id != employee_id:
         raise HTTPException(status_code=403, detail="Can only clock in for yourself")
     
-    # Check if schedule exists
-    schedule = db.query(Schedule).filter(
-        Schedule.employee_id == data.employee_id,
-        Schedule.date == data.date
-    ).first()
-    
-    if not schedule:
-        raise HTTPException(status_code=404, detail="No schedule found for this date")
-    
-    # Check if already clocked in
-    existing = db.query(Attendance).filter(
-        Attendance.employee_id == data.employee_id,
-        Attendance.date == data.date
-    ).first()
-    
-    if existing and existing.clock_in:
-        raise HTTPException(status_code=400, detail="Already clocked in")
-    
     now = datetime.now().time()
     
-    if existing:
-        existing.clock_in = now
-    else:
-        attendance = Attendance(
-            id=uuid.uuid4(),
-            employee_id=data.employee_id,
-            date=data.date,
-            scheduled_start=schedule.start_time,
-            scheduled_end=schedule.end_time,
-            clock_in=now,
-            status="PRESENT"
+    # Copy the scheduled times into a new attendance row, or set clock_in on an
+    # existing row that has none; matches nothing if there is no schedule
+    stmt = pg_insert(Attendance).from_select(
+        ["id", "employee_id", "date", "scheduled_start", "scheduled_end", "clock_in", "status"],
+        select(
+            literal(uuid.uuid4(), Attendance.id.type),
+            Schedule.employee_id,
+            Schedule.date,
+            Schedule.start_time,
+            Schedule.end_time,
+            literal(now, Attendance.clock_in.type),
+            literal("PRESENT")
+        ).where(
+            Schedule.employee_id == data.employee_id,
+            Schedule.date == data.date
         )
-        db.add(attendance)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Attendance.employee_id, Attendance.date],
+        set_={"clock_in": stmt.excluded.clock_in},
+        where=Attendance.clock_in.is_(None)
+    ).returning(Attendance.id)
+    
+    if db.execute(stmt).first() is None:
+        scheduled = db.query(
+            exists().where(Schedule.employee_id == data.employee_id, Schedule.date == data.date)
+        ).scalar()
+        if not scheduled:
+            raise HTTPException(status_code=404, detail="No schedule found for this date")
+        raise HTTPException(status_code=400, detail="Already clocked in")
     
     db.commit()
     
@@ -1311,140 +1736,147 @@ def clock_in(
 def clock_out(
     data: ClockOutRequest,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    if str(data.employee_id) != current_user["user_id"]:
+    if data.employee_id != employee_id:
         raise HTTPException(status_code=403, detail="Can only clock out for yourself")
     
-    attendance = db.query(Attendance).filter(
-        Attendance.employee_id == data.employee_id,
-        Attendance.date == data.date
+    now = datetime.now().time()
+    worked = elapsed_hours(Attendance.clock_in, literal(now, Time))
+    scheduled = elapsed_hours(Attendance.scheduled_start, Attendance.scheduled_end)
+    
+    # Close the open attendance row and compute worked/overtime hours in the
+    # same UPDATE; the clock_out IS NULL guard makes a double submit a no-op
+    clocked_out = db.execute(
+        update(Attendance).where(
+            Attendance.employee_id == data.employee_id,
+            Attendance.date == data.date,
+            Attendance.clock_in.isnot(None),
+            Attendance.clock_out.is_(None)
+        ).values(
+            clock_out=now,
+            worked_hours=worked,
+            overtime_hours=case(
+                (
+                    and_(
+                        Attendance.scheduled_start.isnot(None),
+                        Attendance.scheduled_end.isnot(None),
+                        worked > scheduled
+                    ),
+                    worked - scheduled
+                ),
+                else_=Attendance.overtime_hours
+            )
+        ).returning(Attendance.worked_hours, Attendance.overtime_hours)
     ).first()
     
-    if not attendance or not attendance.clock_in:
-        raise HTTPException(status_code=400, detail="Must clock in first")
-    
-    if attendance.clock_out:
+    if clocked_out is None:
+        clocked_in = db.query(exists().where(
+            Attendance.employee_id == data.employee_id,
+            Attendance.date == data.date,
+            Attendance.clock_in.isnot(None)
+        )).scalar()
+        if not clocked_in:
+            raise HTTPException(status_code=400, detail="Must clock in first")
         raise HTTPException(status_code=400, detail="Already clocked out")
     
-    now = datetime.now().time()
-    attendance.clock_out = now
-    
-    # Calculate worked hours
-    clock_in_dt = datetime.combine(data.date, attendance.clock_in)
-    clock_out_dt = datetime.combine(data.date, now)
-    
-    if clock_out_dt < clock_in_dt:
-        clock_out_dt += timedelta(days=1)
-    
-    duration = clock_out_dt - clock_in_dt
-    worked_hours = duration.total_seconds() / 3600
-    
-    attendance.worked_hours = worked_hours
-    
-    # Calculate overtime if worked more than scheduled
-    if attendance.scheduled_start and attendance.scheduled_end:
-        scheduled_start_dt = datetime.combine(data.date, attendance.scheduled_start)
-        scheduled_end_dt = datetime.combine(data.date, attendance.scheduled_end)
-        
-        if scheduled_end_dt < scheduled_start_dt:
-            scheduled_end_dt += timedelta(days=1)
-        
-        scheduled_duration = scheduled_end_dt - scheduled_start_dt
-        scheduled_hours = scheduled_duration.total_seconds() / 3600
-        
-        if worked_hours > scheduled_hours:
-            attendance.overtime_hours = worked_hours - scheduled_hours
-    
     db.commit()
     
     return {
         "message": "Clocked out successfully",
         "time": now.isoformat(),
-        "worked_hours": float(worked_hours),
-        "overtime_hours": float(attendance.overtime_hours) if attendance.overtime_hours else 0
+        "worked_hours": float(clocked_out.worked_hours) if clocked_out.worked_hours else 0,
+        "overtime_hours": float(clocked_out.overtime_hours) if clocked_out.overtime_hours else 0
     }
 
 # ============================================================================
 # EMPLOYEE ROUTES - Attendance History
 # ============================================================================
 
-@app.get("/api/employee/attendance")
+@app.get("/api/employee/attendance", response_model=List[EmployeeAttendanceRow])
 def get_employee_attendance(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    employee_id = uuid.UUID(current_user["user_id"])
-    
-    query = db.query(Attendance).filter(Attendance.employee_id == employee_id)
+    query = db.query(
+        Attendance.date,
+        Attendance.scheduled_start,
+        Attendance.scheduled_end,
+        Attendance.clock_in,
+        Attendance.clock_out,
+        Attendance.worked_hours,
+        Attendance.overtime_hours,
+        Attendance.status
+    ).filter(Attendance.employee_id == employee_id)
     
     if start_date:
         query = query.filter(Attendance.date >= start_date)
     if end_date:
         query = query.filter(Attendance.date <= end_date)
     
-    attendances = query.all()
-    
-    return [
-        {
-            "date": a.date.isoformat(),
-            "scheduled_start": a.scheduled_start.isoformat() if a.scheduled_start else None,
-            "scheduled_end": a.scheduled_end.isoformat() if a.scheduled_end else None,
-            "clock_in": a.clock_in.isoformat() if a.clock_in else None,
-            "clock_out": a.clock_out.isoformat() if a.clock_out else None,
-            "worked_hours": float(a.worked_hours) if a.worked_hours else 0,
-            "overtime_hours": float(a.overtime_hours) if a.overtime_hours else 0,
-            "status": a.status
-        }
+    attendances = query.order_by(Attendance.date.desc(), Attendance.id).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        EmployeeAttendanceRow(
+            a.date,
+            a.scheduled_start,
+            a.scheduled_end,
+            a.clock_in,
+            a.clock_out,
+            float(a.worked_hours) if a.worked_hours else 0,
+            float(a.overtime_hours) if a.overtime_hours else 0,
+            a.status
+        )
         for a in attendances
-    ]
+    ], limit, offset)
 
 # ============================================================================
 # EMPLOYEE ROUTES - Overtime
 # ============================================================================
 
-@app.get("/api/employee/overtime")
+@app.get("/api/employee/overtime", response_model=List[EmployeeOvertimeRow])
 def get_employee_overtime(
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    employee_id = uuid.UUID(current_user["user_id"])
-    overtimes = db.query(Overtime).filter(Overtime.employee_id == employee_id).all()
-    
-    return [
-        {
-            "id": str(o.id),
-            "date": o.date.isoformat(),
-            "actual_hours": float(o.actual_hours),
-            "approved_hours": float(o.approved_hours) if o.approved_hours else None,
-            "overtime_type": o.overtime_type,
-            "compensation_mode": o.compensation_mode,
-            "approval_status": o.approval_status
-        }
+    overtimes = db.query(
+        Overtime.id,
+        Overtime.date,
+        Overtime.actual_hours,
+        Overtime.approved_hours,
+        Overtime.overtime_type,
+        Overtime.compensation_mode,
+        Overtime.approval_status
+    ).filter(
+        Overtime.employee_id == employee_id
+    ).order_by(Overtime.date.desc(), Overtime.id).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        EmployeeOvertimeRow(
+            o.id,
+            o.date,
+            float(o.actual_hours),
+            float(o.approved_hours) if o.approved_hours else None,
+            o.overtime_type,
+            o.compensation_mode,
+            o.approval_status
+        )
         for o in overtimes
-    ]
+    ], limit, offset)
 
 @app.post("/api/employee/overtime")
 def request_overtime(
     data: OvertimeCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    if str(data.employee_id) != current_user["user_id"]:
+    if data.employee_id != employee_id:
         raise HTTPException(status_code=403, detail="Can only request overtime for yourself")
     
     overtime = Overtime(
@@ -1466,74 +1898,77 @@ def request_overtime(
 # EMPLOYEE ROUTES - Leave
 # ============================================================================
 
-@app.get("/api/employee/leaves")
+@app.get("/api/employee/leaves", response_model=List[EmployeeLeaveRow])
 def get_employee_leaves(
+    limit: int = Query(LIST_PAGE_LIMIT, ge=1, le=LIST_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    employee_id = uuid.UUID(current_user["user_id"])
-    leaves = db.query(EmployeeLeave).filter(EmployeeLeave.employee_id == employee_id).all()
-    
-    return [
-        {
-            "id": str(l.id),
-            "leave_type": l.leave_type,
-            "date": l.date.isoformat(),
-            "duration": l.duration,
-            "reason": l.reason,
-            "approval_status": l.approval_status
-        }
+    leaves = db.query(
+        EmployeeLeave.id,
+        EmployeeLeave.leave_type,
+        EmployeeLeave.date,
+        EmployeeLeave.duration,
+        EmployeeLeave.reason,
+        EmployeeLeave.approval_status
+    ).filter(
+        EmployeeLeave.employee_id == employee_id
+    ).order_by(EmployeeLeave.date.desc(), EmployeeLeave.id).limit(limit + 1).offset(offset).all()
+    
+    return paged_response([
+        EmployeeLeaveRow(
+            l.id,
+            l.leave_type,
+            l.date,
+            l.duration,
+            l.reason,
+            l.approval_status
+        )
         for l in leaves
-    ]
+    ], limit, offset)
 
 @app.post("/api/employee/leaves")
 def request_leave(
     data: LeaveRequest,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    if str(data.employee_id) != current_user["user_id"]:
+    if data.employee_id != employee_id:
         raise HTTPException(status_code=403, detail="Can only request leave for yourself")
     
-    # Check if leave already exists
-    existing = db.query(EmployeeLeave).filter(
-        EmployeeLeave.employee_id == data.employee_id,
-        EmployeeLeave.date == data.date
-    ).first()
-    
-    if existing:
+    # Insert unless leave already exists for the date (uq_leave_employee_date)
+    leave_id = db.execute(
+        pg_insert(EmployeeLeave).values(
+            id=uuid.uuid4(),
+            employee_id=data.employee_id,
+            leave_type=data.leave_type,
+            date=data.date,
+            duration=data.duration,
+            reason=data.reason,
+            approval_status="PENDING"
+        ).on_conflict_do_nothing(
+            index_elements=[EmployeeLeave.employee_id, EmployeeLeave.date]
+        ).returning(EmployeeLeave.id)
+    ).scalar()
+    
+    if leave_id is None:
         raise HTTPException(status_code=400, detail="Leave already requested for this date")
     
-    leave = EmployeeLeave(
-        id=uuid.uuid4(),
-        employee_id=data.employee_id,
-        leave_type=data.leave_type,
-        date=data.date,
-        duration=data.duration,
-        reason=data.reason,
-        approval_status="PENDING"
-    )
-    db.add(leave)
     db.commit()
-    db.refresh(leave)
     
-    return {"id": str(leave.id), "message": "Leave request submitted"}
+    return {"id": str(leave_id), "message": "Leave request submitted"}
 
 @app.get("/api/employee/profile")
 def get_employee_profile(
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    employee_id: uuid.UUID = Depends(require_employee)
 ):
-    if current_user["user_type"] != "employee":
-        raise HTTPException(status_code=403, detail="Employee access required")
-    
-    employee = db.query(Employee).filter(Employee.id == uuid.UUID(current_user["user_id"])).first()
+    employee = db.get(
+        Employee,
+        employee_id,
+        options=[joinedload(Employee.role).joinedload(Role.department)]
+    )
     
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
@@ -1,8 +1,8 @@
-from sqlalchemy import Boolean, Column, String, Integer, Date, Time, DateTime, Numeric, ForeignKey, CheckConstraint, UniqueConstraint, Text
+from sqlalchemy import Boolean, Column, String, Integer, Date, Time, DateTime, Numeric, ForeignKey, CheckConstraint, UniqueConstraint, Index, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column, text
 import uuid
 
 Base = declarative_base()
@@ -47,9 +47,13 @@ class Role(Base):
     employment_type = Column(Text, CheckConstraint("employment_type IN ('FULL_TIME', 'PART_TIME')"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    __table_args__ = (Index('ix_role_department_id', 'department_id'),)
+    
     department = relationship("Department", back_populates="roles")
-    shifts = relationship("Shift", back_populates="role")
-    employees = relationship("Employee", back_populates="role")
+    # Nothing reads these collections; raise so an accidental per-role load
+    # (N+1) fails loudly instead of silently querying
+    shifts = relationship("Shift", back_populates="role", lazy="raise")
+    employees = relationship("Employee", back_populates="role", lazy="raise")
 
 
 class Shift(Base):
@@ -65,8 +69,10 @@ class Shift(Base):
     skills_required = Column(JSONB)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    __table_args__ = (Index('ix_shift_role_id', 'role_id'),)
+    
     role = relationship("Role", back_populates="shifts")
-    schedules = relationship("Schedule", back_populates="shift")
+    schedules = relationship("Schedule", back_populates="shift", lazy="raise")
 
 
 class Employee(Base):
@@ -85,6 +91,8 @@ class Employee(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    __table_args__ = (Index('ix_employee_role_id', 'role_id'),)
+    
     role = relationship("Role", back_populates="employees")
     schedules = relationship("Schedule", back_populates="employee")
     attendances = relationship("Attendance", back_populates="employee")
@@ -103,7 +111,11 @@ class Holiday(Base):
     is_paid = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
-    __table_args__ = (UniqueConstraint('date', 'location', name='uq_holiday_date_location'),)
+    # One holiday per date and location; COALESCE makes a NULL location (applies
+    # everywhere) collide with itself, which a plain unique constraint would not
+    __table_args__ = (
+        Index('uq_holiday_date_location', date, func.coalesce(location, literal_column("''")), unique=True),
+    )
 
 
 class Schedule(Base):
@@ -118,7 +130,15 @@ class Schedule(Base):
     overtime_hours = Column(Numeric(4, 2), default=0)
     is_custom = Column(Boolean, default=False)
     
-    __table_args__ = (UniqueConstraint('employee_id', 'date', name='uq_schedule_employee_date'),)
+    # The unique constraint's index serves per-employee lookups; ix_schedule_date
+    # serves the manager's date-range listing across employees. The scheduler's
+    # hours prefetch reads only the times, so ix_schedule_emp_date_times covers
+    # it as an index-only scan
+    __table_args__ = (
+        UniqueConstraint('employee_id', 'date', name='uq_schedule_employee_date'),
+        Index('ix_schedule_date', 'date'),
+        Index('ix_schedule_emp_date_times', 'employee_id', 'date', postgresql_include=['start_time', 'end_time']),
+    )
     
     employee = relationship("Employee", back_populates="schedules")
     shift = relationship("Shift", back_populates="schedules")
@@ -138,7 +158,10 @@ class Attendance(Base):
     overtime_hours = Column(Numeric(4, 2), default=0)
     status = Column(Text, CheckConstraint("status IN ('PRESENT', 'ABSENT')"))
     
-    __table_args__ = (UniqueConstraint('employee_id', 'date', name='uq_attendance_employee_date'),)
+    __table_args__ = (
+        UniqueConstraint('employee_id', 'date', name='uq_attendance_employee_date'),
+        Index('ix_attendance_date', 'date'),
+    )
     
     employee = relationship("Employee", back_populates="attendances")
 
@@ -175,7 +198,15 @@ class EmployeeLeave(Base):
     source_overtime_id = Column(UUID(as_uuid=True), ForeignKey("overtime.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
-    __table_args__ = (UniqueConstraint('employee_id', 'date', name='uq_leave_employee_date'),)
+    # The scheduler only reads approved leave; the partial index stays small
+    # because pending and rejected requests are left out
+    __table_args__ = (
+        UniqueConstraint('employee_id', 'date', name='uq_leave_employee_date'),
+        Index(
+            'ix_leave_emp_date_approved', 'employee_id', 'date',
+            postgresql_where=text("approval_status = 'APPROVED'")
+        ),
+    )
     
     employee = relationship("Employee", back_populates="leaves")
     source_overtime = relationship("Overtime", back_populates="comp_off_leaves")
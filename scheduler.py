@@ -1,9 +1,18 @@
+from collections import defaultdict
 from datetime import datetime, timedelta, time
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from models import Employee, Role, Shift, Schedule, Holiday, EmployeeLeave
 from typing import List, Dict
 import uuid
 
+# Role.work_days stores English abbreviations; index with shift.day_of_week - 1 (1=Mon)
+WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Rows per INSERT executemany when writing generated schedules
+INSERT_BATCH_SIZE = 10000
+
 class ShiftScheduler:
     """
     Static shift scheduler that assigns shifts to employees based on:
@@ -15,45 +24,81 @@ class ShiftScheduler:
     
     def __init__(self, db: Session):
         self.db = db
+        # Filled by load_calendar() so the per-day checks below stay in memory
+        self._holiday_dates = set()
+        self._leave_days = set()
+        self._scheduled_days = set()
+        self._week_seconds = defaultdict(int)
     
-    def get_day_of_week(self, date: datetime.date) -> int:
+    @staticmethod
+    def get_day_of_week(date: datetime.date) -> int:
         """Convert date to day_of_week (1=Monday, 7=Sunday)"""
         return date.isoweekday()
     
-    def is_holiday(self, date: datetime.date, location: str = None) -> bool:
-        """Check if date is a holiday"""
-        query = self.db.query(Holiday).filter(Holiday.date == date)
+    @staticmethod
+    def get_week_start(date: datetime.date) -> datetime.date:
+        """Monday of the week containing date"""
+        return date - timedelta(days=date.weekday())
+    
+    def load_calendar(
+        self,
+        employee_ids: List[uuid.UUID],
+        start_date: datetime.date,
+        end_date: datetime.date,
+        location: str = None
+    ):
+        """Prefetch holidays, approved leaves and existing schedules for the range in three queries"""
+        holidays = self.db.query(Holiday.date).filter(Holiday.date.between(start_date, end_date))
         if location:
-            query = query.filter((Holiday.location == location) | (Holiday.location.is_(None)))
-        return query.first() is not None
+            holidays = holidays.filter((Holiday.location == location) | (Holiday.location.is_(None)))
+        self._holiday_dates = {holiday_date for (holiday_date,) in holidays}
+        
+        self._leave_days = set(self.db.query(EmployeeLeave.employee_id, EmployeeLeave.date).filter(
+            EmployeeLeave.employee_id.in_(employee_ids),
+            EmployeeLeave.date.between(start_date, end_date),
+            EmployeeLeave.approval_status == 'APPROVED'
+        ))
+        
+        # Whole weeks, so the weekly limit also counts days just outside the range
+        week_start = self.get_week_start(start_date)
+        week_end = self.get_week_start(end_date) + timedelta(days=6)
+        self._scheduled_days = set()
+        self._week_seconds = defaultdict(int)
+        for employee_id, schedule_date, start_time, end_time in self.db.query(
+            Schedule.employee_id,
+            Schedule.date,
+            Schedule.start_time,
+            Schedule.end_time
+        ).filter(
+            Schedule.employee_id.in_(employee_ids),
+            Schedule.date.between(week_start, week_end)
+        ):
+            self._scheduled_days.add((employee_id, schedule_date))
+            self._week_seconds[(employee_id, self.get_week_start(schedule_date))] += \
+                self.calculate_seconds(start_time, end_time)
+    
+    def is_holiday(self, date: datetime.date) -> bool:
+        """Check if date is a holiday (see load_calendar)"""
+        return date in self._holiday_dates
     
     def has_leave(self, employee_id: uuid.UUID, date: datetime.date) -> bool:
-        """Check if employee has approved leave on date"""
-        leave = self.db.query(EmployeeLeave).filter(
-            EmployeeLeave.employee_id == employee_id,
-            EmployeeLeave.date == date,
-            EmployeeLeave.approval_status == 'APPROVED'
-        ).first()
-        return leave is not None
+        """Check if employee has approved leave on date (see load_calendar)"""
+        return (employee_id, date) in self._leave_days
     
-    def is_available(self, employee: Employee, date: datetime.date, shift: Shift) -> bool:
-        """Check if employee is available for the shift"""
+    def is_eligible(self, employee: Employee, role: Role, shift: Shift) -> bool:
+        """Check the rules that depend only on the shift's weekday, not the date"""
         # Check if employee is active
         if not employee.is_active:
             return False
         
-        # Check if employee has leave
-        if self.has_leave(employee.id, date):
-            return False
-        
         # Check role work days
-        day_name = date.strftime('%a')
-        if employee.role.work_days and day_name not in employee.role.work_days:
+        day_name = WEEKDAY_NAMES[shift.day_of_week - 1]
+        if role.work_days and day_name not in role.work_days:
             return False
         
         # Check employee availability (if specified)
         if employee.availability:
-            day_key = str(self.get_day_of_week(date))
+            day_key = str(shift.day_of_week)
             if day_key in employee.availability:
                 avail = employee.availability[day_key]
                 if not avail.get('available', True):
@@ -61,52 +106,47 @@ class ShiftScheduler:
         
         # Check skills match (if shift requires skills)
         if shift.skills_required:
-            employee_skills = employee.skills or []
-            required_skills = shift.skills_required
-            if not all(skill in employee_skills for skill in required_skills):
+            if not set(shift.skills_required).issubset(employee.skills or ()):
                 return False
         
         return True
     
-    def calculate_hours(self, start_time: time, end_time: time) -> float:
-        """Calculate hours between two times"""
-        start_dt = datetime.combine(datetime.today(), start_time)
-        end_dt = datetime.combine(datetime.today(), end_time)
+    @staticmethod
+    def calculate_seconds(start_time: time, end_time: time) -> int:
+        """Calculate whole seconds between two times (sub-second parts are ignored)"""
+        seconds = ((end_time.hour - start_time.hour) * 3600 +
+                   (end_time.minute - start_time.minute) * 60 +
+                   (end_time.second - start_time.second))
         
         # Handle overnight shifts
-        if end_dt < start_dt:
-            end_dt += timedelta(days=1)
+        if seconds < 0:
+            seconds += 86400
         
-        duration = end_dt - start_dt
-        return duration.total_seconds() / 3600
+        return seconds
     
-    def get_weekly_scheduled_hours(self, employee_id: uuid.UUID, start_date: datetime.date) -> float:
-        """Calculate total scheduled hours for the week"""
-        week_start = start_date - timedelta(days=start_date.weekday())
-        week_end = week_start + timedelta(days=6)
-        
-        schedules = self.db.query(Schedule).filter(
-            Schedule.employee_id == employee_id,
-            Schedule.date >= week_start,
-            Schedule.date <= week_end
-        ).all()
-        
-        total_hours = 0
-        for schedule in schedules:
-            total_hours += self.calculate_hours(schedule.start_time, schedule.end_time)
-        
-        return total_hours
+    def is_scheduled(self, employee_id: uuid.UUID, date: datetime.date) -> bool:
+        """Check if employee already has a schedule on date, including ones queued by this run"""
+        return (employee_id, date) in self._scheduled_days
+    
+    def get_weekly_scheduled_seconds(self, employee_id: uuid.UUID, start_date: datetime.date) -> int:
+        """Total scheduled seconds for the week, including schedules queued by this run"""
+        return self._week_seconds.get((employee_id, self.get_week_start(start_date)), 0)
     
     def generate_schedule(
         self, 
         role_id: uuid.UUID, 
         start_date: datetime.date, 
         end_date: datetime.date,
-        location: str = None
+        location: str = None,
+        include_details: bool = True
     ) -> Dict:
         """
         Generate schedules for all employees in a role for a date range
         
+        With include_details=False only the created/skipped counts are
+        returned, so long ranges don't build a per-schedule payload.
+        Detail entries hold date/time/UUID objects for ORJSONResponse.
+        
         Algorithm:
         1. Get all shifts for the role
         2. For each day in range:
@@ -116,7 +156,7 @@ class ShiftScheduler:
         """
         
         # Get role and validate
-        role = self.db.query(Role).filter(Role.id == role_id).first()
+        role = self.db.get(Role, role_id)
         if not role:
             return {"error": "Role not found"}
         
@@ -135,96 +175,143 @@ class ShiftScheduler:
         if not shifts:
             return {"error": "No shifts defined for this role"}
         
+        # Weekly limit in seconds; exact for Numeric(4, 2) hours
+        weekly_limit = int(role.weekly_hours_limit * 3600) if role.weekly_hours_limit else None
+        
+        # Shifts without a day_of_week never match a date, so leave them out
+        # of the per-weekday lookups (is_eligible needs the weekday)
+        shifts = [s for s in shifts if s.day_of_week is not None]
+        
+        # Shift lengths and per-weekday ordering don't change across the range
+        shift_seconds = {s.id: self.calculate_seconds(s.start_time, s.end_time) for s in shifts}
+        shifts_by_day = defaultdict(list)
+        for s in shifts:
+            shifts_by_day[s.day_of_week].append(s)
+        # Sort shifts by priority (higher priority first)
+        for day_shifts in shifts_by_day.values():
+            day_shifts.sort(key=lambda x: x.priority or 0, reverse=True)
+        
+        # Candidates per shift; only leave varies by date inside the loop
+        eligible_by_shift = {
+            s.id: [emp for emp in employees if self.is_eligible(emp, role, s)]
+            for s in shifts
+        }
+        
+        # Serialize generators for the same role until commit, so the prefetch
+        # below sees every schedule a concurrent run has written
+        self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(str(role_id)))))
+        
+        self.load_calendar([emp.id for emp in employees], start_date, end_date, location)
+        
         created_schedules = []
         skipped_days = []
+        skipped = 0
+        schedule_rows = []
         
         current_date = start_date
         while current_date <= end_date:
             # Skip holidays
-            if self.is_holiday(current_date, location):
-                skipped_days.append({
-                    "date": current_date.isoformat(),
-                    "reason": "Holiday"
-                })
+            if self.is_holiday(current_date):
+                skipped += 1
+                if include_details:
+                    skipped_days.append({
+                        "date": current_date,
+                        "reason": "Holiday"
+                    })
                 current_date += timedelta(days=1)
                 continue
             
             # Get shifts for this day of week
-            day_of_week = self.get_day_of_week(current_date)
-            day_shifts = [s for s in shifts if s.day_of_week == day_of_week]
-            
-            # Sort shifts by priority (higher priority first)
-            day_shifts.sort(key=lambda x: x.priority or 0, reverse=True)
+            day_shifts = shifts_by_day.get(self.get_day_of_week(current_date), ())
             
             for shift in day_shifts:
-                # Find available employees for this shift
-                available_employees = [
-                    emp for emp in employees
-                    if self.is_available(emp, current_date, shift)
-                ]
-                
-                # Check weekly hours limit
-                available_employees = [
-                    emp for emp in available_employees
-                    if not role.weekly_hours_limit or 
-                    self.get_weekly_scheduled_hours(emp.id, current_date) + 
-                    self.calculate_hours(shift.start_time, shift.end_time) <= float(role.weekly_hours_limit)
-                ]
-                
-                if not available_employees:
-                    skipped_days.append({
-                        "date": current_date.isoformat(),
-                        "shift": shift.name,
-                        "reason": "No available employees"
-                    })
-                    continue
-                
-                # Simple assignment: take first available employee
+                # Simple assignment: take the first available employee that is
+                # not scheduled that day, not on leave and stays within the
+                # weekly hours limit
                 # In production, you might want round-robin or load balancing
-                selected_employee = available_employees[0]
-                
-                # Check if schedule already exists
-                existing = self.db.query(Schedule).filter(
-                    Schedule.employee_id == selected_employee.id,
-                    Schedule.date == current_date
-                ).first()
+                selected_employee = None
+                already_scheduled = None
+                for emp in eligible_by_shift[shift.id]:
+                    if self.is_scheduled(emp.id, current_date):
+                        already_scheduled = already_scheduled or emp
+                        continue
+                    if self.has_leave(emp.id, current_date):
+                        continue
+                    if (weekly_limit is not None and
+                            self.get_weekly_scheduled_seconds(emp.id, current_date) +
+                            shift_seconds[shift.id] > weekly_limit):
+                        continue
+                    selected_employee = emp
+                    break
                 
-                if existing:
-                    skipped_days.append({
-                        "date": current_date.isoformat(),
-                        "employee": selected_employee.name,
-                        "reason": "Already scheduled"
-                    })
+                if selected_employee is None:
+                    skipped += 1
+                    if include_details:
+                        if already_scheduled is not None:
+                            skipped_days.append({
+                                "date": current_date,
+                                "employee": already_scheduled.name,
+                                "reason": "Already scheduled"
+                            })
+                        else:
+                            skipped_days.append({
+                                "date": current_date,
+                                "shift": shift.name,
+                                "reason": "No available employees"
+                            })
                     continue
                 
-                # Create schedule
-                schedule = Schedule(
-                    id=uuid.uuid4(),
-                    employee_id=selected_employee.id,
-                    shift_id=shift.id,
-                    date=current_date,
-                    start_time=shift.start_time,
-                    end_time=shift.end_time,
-                    is_custom=False
-                )
-                
-                self.db.add(schedule)
-                created_schedules.append({
-                    "date": current_date.isoformat(),
-                    "employee": selected_employee.name,
-                    "shift": shift.name,
-                    "start_time": shift.start_time.isoformat(),
-                    "end_time": shift.end_time.isoformat()
+                # Queue schedule row for a single bulk INSERT
+                schedule_id = uuid.uuid4()
+                schedule_rows.append({
+                    "id": schedule_id,
+                    "employee_id": selected_employee.id,
+                    "shift_id": shift.id,
+                    "date": current_date,
+                    "start_time": shift.start_time,
+                    "end_time": shift.end_time,
+                    "is_custom": False
                 })
+                self._scheduled_days.add((selected_employee.id, current_date))
+                self._week_seconds[(selected_employee.id, self.get_week_start(current_date))] += \
+                    shift_seconds[shift.id]
+                if include_details:
+                    created_schedules.append({
+                        "id": schedule_id,
+                        "date": current_date,
+                        "employee": selected_employee.name,
+                        "shift": shift.name,
+                        "start_time": shift.start_time,
+                        "end_time": shift.end_time
+                    })
             
             current_date += timedelta(days=1)
         
-        # Commit all schedules
+        # Insert in bounded batches and commit once. Schedules added by hand
+        # since the prefetch (not covered by the lock) hit uq_schedule_employee_date
+        # and are skipped rather than aborting the batch
+        stmt = pg_insert(Schedule).on_conflict_do_nothing(
+            index_elements=[Schedule.employee_id, Schedule.date]
+        ).returning(Schedule.id)
+        inserted = set()
+        for i in range(0, len(schedule_rows), INSERT_BATCH_SIZE):
+            inserted.update(self.db.execute(stmt, schedule_rows[i:i + INSERT_BATCH_SIZE]).scalars())
         self.db.commit()
         
-        return {
-            "created": len(created_schedules),
-            "skipped": len(skipped_days),
-            "schedules": created_schedules,
-            "skipped_details": skipped_days
+        conflicts = len(schedule_rows) - len(inserted)
+        skipped += conflicts
+        if include_details and conflicts:
+            skipped_days.extend(
+                {"date": s["date"], "employee": s["employee"], "reason": "Already scheduled"}
+                for s in created_schedules if s["id"] not in inserted
+            )
+            created_schedules = [s for s in created_schedules if s["id"] in inserted]
+        
+        result = {
+            "created": len(inserted),
+            "skipped": skipped
         }
+        if include_details:
+            result["schedules"] = created_schedules
+            result["skipped_details"] = skipped_days
+        return result